@@ -2,13 +2,26 @@ import matplotlib.pyplot as plt
 import numpy as np
 from enum import Enum
 from dataclasses import dataclass
+from typing import Optional
 import math
+from calculoTrajetoria import TrajectoryCalculator, DEFAULT_PROFILES, CURRENT_PROFILES
+
+# Pontuações mínimas dos vereditos de habitabilidade
+HABITABLE_SCORE = 60
+MARGINAL_SCORE = 30
+
+# Parâmetros do modelo de habitabilidade e crescimento populacional
+HABITABLE_BONUS = 1.1  # Bônus de 10% para planetas na zona habitável
+MAX_REPRODUCTIVE_EFFICIENCY = 0.8  # Máximo de 80% de eficiência reprodutiva
+GESTATION_INTERVAL = 1.5  # Anos entre gestações
+EGG_SUCCESS_RATE = 0.9  # 90% de sucesso dos óvulos fecundados
+MIN_CHILD_SURVIVAL = 0.7  # Sobrevivência infantil mínima (70%)
+CHILD_SURVIVAL_GAIN = 0.3  # Ganho máximo com a pontuação do planeta (até 100%)
 
 @dataclass
 class PlanetData:
     name: str
-    distance_au: float  # Distância em Unidades Astronômicas
-    travel_time_years: float  # Tempo estimado de viagem em anos
+    distance_au: float  # Distância heliocêntrica do alvo em Unidades Astronômicas
     star_distance: float  # Distância da estrela em AU
     habitable_zone: bool
     climate_stability: int
@@ -25,6 +38,7 @@ class PlanetData:
     disease_prevalence: int
     technology_development: int
     social_stability: int
+    travel_time_years: Optional[float] = None  # Calculado a partir de distance_au (anos)
 
 class PlanetType(Enum):
     TERRA = 1
@@ -75,7 +89,6 @@ class PlanetComparisonTool:
             PlanetType.TERRA: PlanetData(
                 name="Terra",
                 distance_au=1.0,
-                travel_time_years=0,
                 star_distance=1.0,
                 habitable_zone=True,
                 climate_stability=90,
@@ -96,7 +109,6 @@ class PlanetComparisonTool:
             PlanetType.MARTE: PlanetData(
                 name="Marte",
                 distance_au=1.52,
-                travel_time_years=0.5,  # Com tecnologia atual
                 star_distance=1.52,
                 habitable_zone=False,
                 climate_stability=25,
@@ -117,7 +129,6 @@ class PlanetComparisonTool:
             PlanetType.EUROPA: PlanetData(
                 name="Europa (Júpiter)",
                 distance_au=5.2,
-                travel_time_years=6,
                 star_distance=5.2,
                 habitable_zone=False,
                 climate_stability=40,
@@ -138,7 +149,6 @@ class PlanetComparisonTool:
             PlanetType.TITÃ: PlanetData(
                 name="Titã (Saturno)",
                 distance_au=9.5,
-                travel_time_years=7,
                 star_distance=9.5,
                 habitable_zone=False,
                 climate_stability=30,
@@ -159,7 +169,6 @@ class PlanetComparisonTool:
             PlanetType.PROXIMA_B: PlanetData(
                 name="Proxima Centauri b",
                 distance_au=268770,  # ~4.24 anos-luz
-                travel_time_years=6300,  # Com tecnologia atual
                 star_distance=0.0485,
                 habitable_zone=True,
                 climate_stability=60,
@@ -180,7 +189,6 @@ class PlanetComparisonTool:
             PlanetType.TRAPPIST_1E: PlanetData(
                 name="TRAPPIST-1e",
                 distance_au=395369,  # ~6 anos-luz
-                travel_time_years=9000,  # Com tecnologia atual
                 star_distance=0.029,
                 habitable_zone=True,
                 climate_stability=55,
@@ -199,9 +207,18 @@ class PlanetComparisonTool:
                 social_stability=45
             )
         }
+
+        # Tempos de viagem calculados pela trajetória, não mais fixos
+        self.trajectory = TrajectoryCalculator()
+        planets = list(self.real_planets.values())
+        transfers = self.trajectory.compute([p.distance_au for p in planets], CURRENT_PROFILES)
+        for planet, times in zip(planets, transfers.travel_time_years):
+            planet.travel_time_years = float(times.min())
         
         self.current_mission = None
         self.custom_planet = None
+        # ResultWriter opcional para registrar avaliações; fechado ao sair de run()
+        self.result_writer = None
 
     def input_mission_parameters(self):
         """Coleta dados sobre a missão de colonização"""
@@ -233,19 +250,19 @@ class PlanetComparisonTool:
             return 0, 0
         
         # Fator de viabilidade reprodutiva (0-1)
-        reproductive_factor = planet_score / 100 * 0.8  # Máximo de 80% de eficiência
+        reproductive_factor = planet_score / 100 * MAX_REPRODUCTIVE_EFFICIENCY
         
         # Cálculos básicos de crescimento populacional
         fertile_couples = min(self.current_mission.male_count, self.current_mission.female_count)
-        potential_births = fertile_couples * (self.current_mission.mission_duration / 1.5)  # Considerando 1.5 anos entre gestações
+        potential_births = fertile_couples * (self.current_mission.mission_duration / GESTATION_INTERVAL)
         
         # Efeito dos óvulos fecundados
-        egg_contribution = self.current_mission.fertilized_eggs * 0.9  # 90% de sucesso
+        egg_contribution = self.current_mission.fertilized_eggs * EGG_SUCCESS_RATE
         
         total_children = (potential_births + egg_contribution) * reproductive_factor
         
         # Mortalidade infantil estimada
-        survival_rate = 0.7 + (planet_score / 100 * 0.3)  # Entre 70% e 100%
+        survival_rate = MIN_CHILD_SURVIVAL + (planet_score / 100 * CHILD_SURVIVAL_GAIN)
         surviving_children = total_children * survival_rate
         
         return int(total_children), int(surviving_children)
@@ -260,8 +277,15 @@ class PlanetComparisonTool:
         
         # Coletar dados astronômicos
         print("\nDados Astronômicos:")
-        distance_au = float(input("Distância da Terra (UA): "))
-        travel_time = float(input("Tempo estimado de viagem (anos): "))
+        while True:
+            try:
+                distance_au = float(input("Distância do alvo ao Sol (UA): "))
+                if distance_au > 0:
+                    break
+                else:
+                    print("A distância deve ser maior que zero")
+            except ValueError:
+                print("Por favor, insira um número válido")
         star_distance = float(input("Distância da estrela (UA): "))
         habitable = input("Está na zona habitável? (s/n): ").lower() == 's'
         
@@ -284,7 +308,7 @@ class PlanetComparisonTool:
         self.custom_planet = PlanetData(
             name=name,
             distance_au=distance_au,
-            travel_time_years=travel_time,
+            travel_time_years=self.trajectory.travel_time(distance_au),
             star_distance=star_distance,
             habitable_zone=habitable,
             climate_stability=factors['climate_stability'],
@@ -313,10 +337,19 @@ class PlanetComparisonTool:
         
         # Ajuste para planetas na zona habitável
         if planet_data.habitable_zone:
-            total_score = min(100, total_score * 1.1)  # Bônus de 10%
+            total_score = min(100, total_score * HABITABLE_BONUS)
         
         return total_score * 100
 
+    def evaluate_planets_batch(self, values, habitable, male_count, female_count,
+                               fertilized_eggs, mission_duration, use_numba=None):
+        """Calcula pontuação, nascimentos e sobreviventes para linhas planeta × missão"""
+        # Importado aqui para que o uso interativo não carregue o Numba
+        from kernelsSobrevivencia import planet_outcomes_batch
+        weights = [self.weights[factor] for factor in self.factors]
+        return planet_outcomes_batch(values, weights, habitable, male_count, female_count,
+                                     fertilized_eggs, mission_duration, use_numba)
+
     def show_comparison(self):
         """Mostra a comparação detalhada"""
         if not self.custom_planet and not hasattr(self, 'selected_planet'):
@@ -339,19 +372,28 @@ class PlanetComparisonTool:
         
         print(f"=== DADOS ASTRONÔMICOS ===")
         print(f"{'Nome':<25}: {planet.name}")
-        print(f"{'Distância da Terra (UA)':<25}: {planet.distance_au:.2f}")
+        print(f"{'Distância ao Sol (UA)':<25}: {planet.distance_au:.2f}")
         print(f"{'Tempo de viagem (anos)':<25}: {planet.travel_time_years:.1f}")
         print(f"{'Distância da estrela (UA)':<25}: {planet.star_distance:.3f}")
         print(f"{'Zona habitável':<25}: {'Sim' if planet.habitable_zone else 'Não'}")
+
+        print("\n=== OPÇÕES DE PROPULSÃO ===")
+        transfers = self.trajectory.compute([planet.distance_au], DEFAULT_PROFILES)
+        for j, profile in enumerate(DEFAULT_PROFILES):
+            if transfers.feasible[0, j]:
+                flyby = " - sobrevoo, sem captura" if transfers.flyby[0, j] else ""
+                print(f"{profile.name:<25}: {transfers.travel_time_years[0, j]:.1f} anos (Δv {transfers.delta_v[0, j]:.1f} km/s{flyby})")
+            else:
+                print(f"{profile.name:<25}: inviável (Δv necessário {transfers.delta_v[0, j]:.1f} km/s)")
         
         print("\n=== TAXAS DE SOBREVIVÊNCIA ===")
         print(f"{'Terra':<25}: {earth_score:.1f}%")
         print(f"{planet.name:<25}: {planet_score:.1f}%")
         print(f"{'Diferença':<25}: {abs(earth_score - planet_score):.1f} pontos")
         
-        if planet_score >= 60:
+        if planet_score >= HABITABLE_SCORE:
             veredict = "HABITÁVEL (Satisfaz requisitos mínimos)"
-        elif planet_score >= 30:
+        elif planet_score >= MARGINAL_SCORE:
             veredict = "MARGINALMENTE HABITÁVEL (Requer tecnologia adicional)"
         else:
             veredict = "INABITÁVEL (Condições extremamente hostis)"
@@ -367,10 +409,29 @@ class PlanetComparisonTool:
             print(f"- Nascimentos potenciais: {potential}")
             print(f"- Crianças sobreviventes: {surviving} (taxa de {surviving/potential*100:.1f}%)")
             print(f"- População final estimada: {self.current_mission.male_count + self.current_mission.female_count + surviving}")
+
+            if self.result_writer:
+                self.record_evaluation(planet, planet_score, potential, surviving)
         
         # Gráficos
         self.plot_comparison(earth_score, planet_score, earth, planet)
 
+    def record_evaluation(self, planet, planet_score, births, survivors):
+        """Registra a avaliação atual no armazenamento de resultados"""
+        transfers = self.trajectory.compute([planet.distance_au], CURRENT_PROFILES)
+        self.result_writer.append({
+            'planet_id': planet.name,
+            'male_count': self.current_mission.male_count,
+            'female_count': self.current_mission.female_count,
+            'fertilized_eggs': self.current_mission.fertilized_eggs,
+            'mission_duration': self.current_mission.mission_duration,
+            'score': planet_score,
+            'births': births,
+            'survivors': survivors,
+            'habitable': planet_score >= HABITABLE_SCORE,
+            'feasible': bool(transfers.feasible.any())
+        })
+
     def plot_comparison(self, earth_score, planet_score, earth, planet):
         """Cria gráficos comparativos"""
         # Gráfico de barras comparativo
@@ -454,6 +515,8 @@ class PlanetComparisonTool:
             
             elif choice == '5':
                 print("Encerrando o programa...")
+                if self.result_writer:
+                    self.result_writer.close()
                 break
             
             else:
@@ -462,4 +525,4 @@ class PlanetComparisonTool:
 # Executar o programa
 if __name__ == "__main__":
     tool = PlanetComparisonTool()
-    tool.run()
\ No newline at end of file
+    tool.run()
\ No newline at end of file
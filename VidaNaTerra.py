@@ -92,6 +92,15 @@ class HumanSurvivalCalculator:
         
         return max(0, min(100, survival_prob))  # Garante que está entre 0 e 100
     
+    def calculate_survival_probability_batch(self, values, use_numba=None):
+        """Calcula a probabilidade de sobrevivência para várias linhas de fatores"""
+        # Importado aqui para que o uso interativo não carregue o Numba
+        from kernelsSobrevivencia import survival_probability_batch
+        ideals = [self.ideal_values[factor] for factor in self.factors]
+        weights = [data['weight'] for data in self.factors.values()]
+        return survival_probability_batch(values, ideals, weights,
+                                          self.get_current_year_factor(), use_numba)
+    
     def get_survival_assessment(self, probability):
         """Retorna uma avaliação qualitativa baseada na probabilidade"""
         if probability >= 90:
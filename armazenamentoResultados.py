@@ -0,0 +1,227 @@
+import numpy as np
+import operator
+import json
+import os
+
+# Colunas gravadas para cada avaliação e seus tipos
+RESULT_SCHEMA = {
+    'planet_id': np.str_,
+    'male_count': np.int64,
+    'female_count': np.int64,
+    'fertilized_eggs': np.int64,
+    'mission_duration': np.float64,
+    'score': np.float64,
+    'births': np.int64,
+    'survivors': np.int64,
+    'habitable': np.bool_,  # Veredito HABITÁVEL na análise comparativa
+    'feasible': np.bool_  # Alguma propulsão atual alcança o planeta
+}
+
+MANIFEST_FILE = 'manifest.json'
+
+# Operadores aceitos nos filtros (coluna, operador, valor)
+OPERATORS = {
+    '==': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge
+}
+
+class ResultWriter:
+    def __init__(self, directory, chunk_size=100_000, schema=RESULT_SCHEMA):
+        self.directory = directory
+        self.chunk_size = chunk_size
+        self.schema = schema
+        # Segmentos de arrays por coluna; registros avulsos ficam em _scalars
+        self._buffer = {column: [] for column in schema}
+        self._scalars = {column: [] for column in schema}
+        self._buffered_rows = 0
+
+        os.makedirs(directory, exist_ok=True)
+        manifest_schema = {column: np.dtype(dtype).str for column, dtype in schema.items()}
+        # Continua um armazenamento existente em vez de sobrescrevê-lo
+        self.manifest = _load_manifest(directory)
+        if self.manifest is None:
+            # Um armazenamento recém-criado já pode ser lido, mesmo vazio
+            self.manifest = {'schema': manifest_schema, 'chunks': []}
+            _save_manifest(directory, self.manifest)
+        elif self.manifest['schema'] != manifest_schema:
+            raise ValueError(f"O esquema de {directory} não corresponde ao informado.")
+
+    def append(self, record):
+        """Adiciona um registro (dicionário coluna -> valor) ao bloco atual"""
+        for column in self.schema:
+            self._scalars[column].append(record[column])
+        self._buffered_rows += 1
+
+        if self._buffered_rows >= self.chunk_size:
+            self.flush()
+
+    def append_batch(self, columns):
+        """Adiciona vários registros de uma vez (dicionário coluna -> sequência)"""
+        sizes = {len(columns[column]) for column in self.schema}
+        if len(sizes) != 1:
+            raise ValueError("Todas as colunas devem ter o mesmo número de linhas.")
+
+        self._stage_scalars()
+        for column, dtype in self.schema.items():
+            self._buffer[column].append(np.asarray(columns[column], dtype=dtype))
+        self._buffered_rows += sizes.pop()
+
+        while self._buffered_rows >= self.chunk_size:
+            self._write_chunk(self.chunk_size)
+
+    def flush(self):
+        """Grava em disco os registros pendentes"""
+        if self._buffered_rows:
+            self._write_chunk(self._buffered_rows)
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _stage_scalars(self):
+        """Converte os registros avulsos pendentes em um segmento de array"""
+        if not self._scalars[next(iter(self.schema))]:
+            return
+        for column, dtype in self.schema.items():
+            self._buffer[column].append(np.asarray(self._scalars[column], dtype=dtype))
+            self._scalars[column] = []
+
+    def _write_chunk(self, rows):
+        self._stage_scalars()
+        arrays = {}
+        stats = {}
+        nan_columns = []
+        for column in self.schema:
+            segments = self._buffer[column]
+            data = segments[0] if len(segments) == 1 else np.concatenate(segments)
+            arrays[column] = data[:rows]
+            # O restante continua como visão, sem cópia, até o próximo bloco
+            self._buffer[column] = [data[rows:]] if len(data) > rows else []
+            # Mínimo e máximo de cada coluna permitem pular blocos na leitura
+            stats[column] = _bounds(arrays[column])
+            if arrays[column].dtype.kind == 'f' and np.isnan(arrays[column]).any():
+                nan_columns.append(column)
+        self._buffered_rows -= rows
+
+        name = f"chunk_{len(self.manifest['chunks']):06d}.npz"
+        np.savez_compressed(os.path.join(self.directory, name), **arrays)
+
+        self.manifest['chunks'].append({
+            'file': name, 'rows': rows, 'stats': stats, 'nan_columns': nan_columns
+        })
+        _save_manifest(self.directory, self.manifest)
+
+class ResultReader:
+    def __init__(self, directory):
+        self.directory = directory
+        self.manifest = _load_manifest(directory)
+        if self.manifest is None:
+            raise FileNotFoundError(f"Nenhum resultado encontrado em {directory}")
+        self.columns = list(self.manifest['schema'])
+
+    def __len__(self):
+        return sum(chunk['rows'] for chunk in self.manifest['chunks'])
+
+    def iter_chunks(self, columns=None, filters=None):
+        """Lê bloco a bloco apenas as colunas pedidas e as linhas que passam nos filtros"""
+        columns = list(columns) if columns else self.columns
+        filters = filters or []
+        for column in list(columns) + [f[0] for f in filters]:
+            if column not in self.manifest['schema']:
+                raise KeyError(f"Coluna desconhecida: {column}")
+        for _, op, _ in filters:
+            if op not in OPERATORS:
+                raise ValueError(f"Operador inválido: {op}")
+
+        for chunk in self.manifest['chunks']:
+            nan_columns = chunk.get('nan_columns', [])
+            if not all(_may_match(chunk['stats'].get(column), op, value, column in nan_columns)
+                       for column, op, value in filters):
+                continue
+
+            # O .npz é carregado sob demanda: só as colunas acessadas são descompactadas
+            with np.load(os.path.join(self.directory, chunk['file'])) as data:
+                mask = None
+                for column, op, value in filters:
+                    matches = OPERATORS[op](data[column], value)
+                    mask = matches if mask is None else mask & matches
+
+                if mask is not None and not mask.any():
+                    continue
+
+                result = {}
+                for column in columns:
+                    values = data[column]
+                    result[column] = values if mask is None else values[mask]
+            yield result
+
+    def read(self, columns=None, filters=None):
+        """Lê o armazenamento inteiro, concatenando os blocos selecionados"""
+        columns = list(columns) if columns else self.columns
+        parts = {column: [] for column in columns}
+        for chunk in self.iter_chunks(columns, filters):
+            for column in columns:
+                parts[column].append(chunk[column])
+
+        return {
+            column: np.concatenate(values) if values
+            else np.empty(0, dtype=self.manifest['schema'][column])
+            for column, values in parts.items()
+        }
+
+def _bounds(values):
+    """Retorna [mínimo, máximo] de uma coluna como valores JSON (None se desconhecido)"""
+    if values.dtype.kind == 'U':
+        # Textos não têm min/max vetorizados; a ordenação dá o mesmo resultado
+        values = np.sort(values)
+        return [values[0].item(), values[-1].item()]
+    if values.dtype.kind == 'f':
+        # NaN fica fora das estatísticas; coluna só com NaN não tem limites
+        finite = values[~np.isnan(values)]
+        if not len(finite):
+            return [None, None]
+        return [finite.min().item(), finite.max().item()]
+    return [values.min().item(), values.max().item()]
+
+def _may_match(stats, op, value, has_nan=False):
+    """Indica, pelas estatísticas do bloco, se alguma linha pode satisfazer o filtro"""
+    # Sem estatísticas o bloco precisa ser lido; NaN é diferente de qualquer valor
+    if stats is None or None in stats or (op == '!=' and has_nan):
+        return True
+    low, high = stats
+    if op == '==':
+        return low <= value <= high
+    if op == '!=':
+        return not (low == high == value)
+    if op == '<':
+        return low < value
+    if op == '<=':
+        return low <= value
+    if op == '>':
+        return high > value
+    if op == '>=':
+        return high >= value
+    raise ValueError(f"Operador inválido: {op}")
+
+def _load_manifest(directory):
+    path = os.path.join(directory, MANIFEST_FILE)
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+def _save_manifest(directory, manifest):
+    # Grava em arquivo temporário para não corromper o manifesto em caso de falha
+    path = os.path.join(directory, MANIFEST_FILE)
+    with open(path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False)
+    os.replace(path + '.tmp', path)
@@ -0,0 +1,185 @@
+import numpy as np
+from dataclasses import dataclass
+from enum import Enum
+import math
+from functools import lru_cache
+
+# Constantes físicas (unidades: UA, anos, km/s)
+MU_SOL = 4 * math.pi ** 2  # Parâmetro gravitacional do Sol em UA³/ano²
+UA_ANO_EM_KMS = 4.740470  # 1 UA/ano em km/s
+UA_EM_M = 1.495978707e11  # 1 UA em metros
+ANO_EM_S = 3.15576e7  # 1 ano juliano em segundos
+C_MS = 299792458.0  # Velocidade da luz em m/s
+ORBITA_TERRA_AU = 1.0  # Raio orbital de partida
+LIMITE_SISTEMA_PLANETARIO_AU = 100.0  # Além daqui o escape balístico é considerado
+
+class PropulsionType(Enum):
+    IMPULSIVA = 1  # Queimas curtas (química): Hohmann ou escape balístico
+    CONTINUA = 2  # Empuxo contínuo (iônica, aceleração constante)
+
+@dataclass(frozen=True)
+class PropulsionProfile:
+    name: str
+    propulsion_type: PropulsionType
+    delta_v_budget: float  # Delta-v disponível em km/s (math.inf = ilimitado)
+    acceleration: float = 0.0  # Aceleração em m/s² (apenas empuxo contínuo)
+
+# Perfis de propulsão com tecnologia atual
+CURRENT_PROFILES = (
+    PropulsionProfile("Química", PropulsionType.IMPULSIVA, delta_v_budget=20.0),
+    PropulsionProfile("Iônica", PropulsionType.CONTINUA, delta_v_budget=50.0, acceleration=1e-4),
+)
+
+# Perfis padrão, incluindo um conceito futurista de aceleração constante
+DEFAULT_PROFILES = CURRENT_PROFILES + (
+    PropulsionProfile("Aceleração constante 1g", PropulsionType.CONTINUA,
+                      delta_v_budget=math.inf, acceleration=9.81),
+)
+
+@dataclass
+class TransferResult:
+    travel_time_years: np.ndarray  # Forma (planetas, perfis); inf se inviável
+    delta_v: np.ndarray  # Delta-v necessário em km/s
+    feasible: np.ndarray  # Se o delta-v cabe no orçamento do perfil
+    flyby: np.ndarray  # Se a trajetória é um sobrevoo, sem queima de captura
+
+class TrajectoryCalculator:
+    def __init__(self, origin_au=ORBITA_TERRA_AU, cache_size=64):
+        self.origin_au = origin_au
+        # Geometrias repetidas entre chamadas: (perfil, distâncias) -> arrays
+        self._cached_transfer = lru_cache(maxsize=cache_size)(self._transfer_from_key)
+
+    def hohmann_transfer(self, target_au):
+        """Calcula tempo (anos) e delta-v (km/s) de uma transferência de Hohmann"""
+        r1 = self.origin_au
+        r2 = np.asarray(target_au, dtype=float)
+        a = (r1 + r2) / 2
+
+        time = np.pi * np.sqrt(a ** 3 / MU_SOL)
+
+        # Queima de partida e de chegada (velocidades em UA/ano)
+        dv1 = np.abs(np.sqrt(MU_SOL / r1) * (np.sqrt(2 * r2 / (r1 + r2)) - 1))
+        dv2 = np.abs(np.sqrt(MU_SOL / r2) * (1 - np.sqrt(2 * r1 / (r1 + r2))))
+
+        # Sem transferência quando origem e destino coincidem
+        same = np.isclose(r2, r1)
+        time = np.where(same, 0.0, time)
+        delta_v = np.where(same, 0.0, (dv1 + dv2) * UA_ANO_EM_KMS)
+        return time, delta_v
+
+    def ballistic_escape(self, target_au, profile):
+        """Calcula um sobrevoo após uma única queima de escape do Sol (sem captura)"""
+        d = np.abs(np.asarray(target_au, dtype=float) - self.origin_au)
+        v_orbit = math.sqrt(MU_SOL / self.origin_au) * UA_ANO_EM_KMS
+        v_escape = math.sqrt(2 * MU_SOL / self.origin_au) * UA_ANO_EM_KMS
+        escape_dv = v_escape - v_orbit
+
+        # Velocidade residual (hiperbólica) após gastar todo o orçamento
+        v_after = v_orbit + profile.delta_v_budget
+        v_inf = math.sqrt(max(0.0, v_after ** 2 - v_escape ** 2))
+
+        if v_inf > 0:
+            time = d / (v_inf / UA_ANO_EM_KMS)
+        else:
+            time = np.full_like(d, np.inf)
+        # Todo o orçamento é gasto; abaixo do escape o perfil é inviável
+        delta_v = np.full_like(d, max(escape_dv, profile.delta_v_budget))
+        return time, delta_v
+
+    def continuous_thrust(self, distance_au, profile):
+        """Calcula tempo e delta-v para empuxo contínuo (acelera, navega e freia)"""
+        d = np.asarray(distance_au, dtype=float) * UA_EM_M
+        a = profile.acceleration
+
+        if math.isinf(profile.delta_v_budget):
+            # Perfil de aceleração constante com inversão no meio do caminho,
+            # tempo no referencial da Terra (movimento hiperbólico relativístico)
+            time = 2 * np.sqrt((d / (2 * C_MS)) ** 2 + d / a)
+            # Delta-v = a·τ (tempo próprio): duas vezes a rapidez do meio do caminho
+            rapidity = np.arccosh(1 + a * d / (2 * C_MS ** 2))
+            delta_v = 2 * C_MS * rapidity / 1000
+            return time / ANO_EM_S, delta_v
+
+        # Orçamento finito: metade para acelerar, metade para frear
+        # (velocidades baixas o suficiente para a aproximação clássica)
+        v_max = profile.delta_v_budget * 1000 / 2
+        d_accel = v_max ** 2 / (2 * a)
+        reaches_cruise = 2 * d_accel < d
+
+        time = np.where(
+            reaches_cruise,
+            2 * v_max / a + (d - 2 * d_accel) / v_max,
+            2 * np.sqrt(d / a)
+        )
+        delta_v = np.where(reaches_cruise, 2 * v_max, 2 * np.sqrt(a * d)) / 1000
+        return time / ANO_EM_S, delta_v
+
+    def _transfer(self, distances, profile):
+        """Despacha para o modelo de trajetória adequado ao perfil"""
+        if profile.propulsion_type == PropulsionType.CONTINUA:
+            # Empuxo contínuo percorre a separação radial a partir da origem
+            separation = np.abs(distances - self.origin_au)
+            time, delta_v = self.continuous_thrust(separation, profile)
+            return time, delta_v, np.zeros(distances.shape, dtype=bool)
+
+        # Propulsão impulsiva: Hohmann dentro do sistema planetário; fora dele,
+        # o sobrevoo de escape entra como alternativa quando for mais rápido
+        hohmann_time, hohmann_dv = self.hohmann_transfer(distances)
+        escape_time, escape_dv = self.ballistic_escape(distances, profile)
+        outside = distances > LIMITE_SISTEMA_PLANETARIO_AU
+        hohmann_time = np.where(hohmann_dv <= profile.delta_v_budget, hohmann_time, np.inf)
+        escape_time = np.where(outside & (escape_dv <= profile.delta_v_budget),
+                               escape_time, np.inf)
+
+        use_escape = escape_time < hohmann_time
+        # Sem trajetória viável, reporta o menor delta-v que seria necessário
+        neither = np.isinf(hohmann_time) & np.isinf(escape_time)
+        use_escape = np.where(neither, outside & (escape_dv < hohmann_dv), use_escape)
+
+        time = np.where(use_escape, escape_time, hohmann_time)
+        delta_v = np.where(use_escape, escape_dv, hohmann_dv)
+        return time, delta_v, use_escape
+
+    def _transfer_from_key(self, profile, distances_key):
+        distances = np.frombuffer(distances_key, dtype=float)
+        result = self._transfer(distances, profile)
+        # Arrays compartilhados pelo cache não podem ser alterados
+        for array in result:
+            array.flags.writeable = False
+        return result
+
+    def compute(self, distances_au, profiles=DEFAULT_PROFILES):
+        """Calcula tempo de viagem e delta-v para todos os planetas × perfis"""
+        distances = np.atleast_1d(np.asarray(distances_au, dtype=float))
+        if np.any(~(distances > 0)):
+            raise ValueError("As distâncias devem ser positivas (UA).")
+
+        # Geometrias repetidas no catálogo são calculadas uma única vez
+        unique, inverse = np.unique(distances, return_inverse=True)
+        time = np.empty((len(unique), len(profiles)))
+        delta_v = np.empty((len(unique), len(profiles)))
+        flyby = np.empty((len(unique), len(profiles)), dtype=bool)
+
+        key = unique.tobytes()
+        for j, profile in enumerate(profiles):
+            time[:, j], delta_v[:, j], flyby[:, j] = self._cached_transfer(profile, key)
+
+        budgets = np.array([p.delta_v_budget for p in profiles])
+        feasible = (delta_v <= budgets) & np.isfinite(time)
+        time = np.where(feasible, time, np.inf)
+
+        return TransferResult(
+            travel_time_years=time[inverse],
+            delta_v=delta_v[inverse],
+            feasible=feasible[inverse],
+            flyby=flyby[inverse]
+        )
+
+    def travel_time(self, distance_au, profiles=CURRENT_PROFILES):
+        """Retorna o menor tempo de viagem viável (anos) entre os perfis dados"""
+        result = self.compute([distance_au], profiles)
+        return float(result.travel_time_years[0].min())
+
+    def clear_cache(self):
+        """Descarta as geometrias memorizadas"""
+        self._cached_transfer.cache_clear()
@@ -0,0 +1,108 @@
+import numpy as np
+
+# Numba é opcional: sem ele os mesmos cálculos rodam com NumPy
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Mesmos parâmetros dos métodos de referência, definidos uma única vez
+from CalculoParaResultado import (HABITABLE_BONUS, MAX_REPRODUCTIVE_EFFICIENCY,
+                                  GESTATION_INTERVAL, EGG_SUCCESS_RATE,
+                                  MIN_CHILD_SURVIVAL, CHILD_SURVIVAL_GAIN)
+
+def _survival_probability_numpy(values, ideals, weights, year_factor, total_weight):
+    total_score = np.zeros(values.shape[0])
+    # Acumula fator a fator, na mesma ordem do cálculo de referência
+    for j in range(values.shape[1]):
+        score = np.minimum(values[:, j], 100) / ideals[j]
+        total_score += np.clip(score, 0, 1) * weights[j]
+    total_score *= year_factor
+    return np.clip(total_score / total_weight * 100, 0, 100)
+
+def _planet_outcomes_numpy(values, weights, habitable, males, females, eggs, duration):
+    total_score = np.zeros(values.shape[0])
+    for j in range(values.shape[1]):
+        total_score += (values[:, j] / 100) * weights[j]
+    total_score = np.where(habitable, np.minimum(100, total_score * HABITABLE_BONUS), total_score)
+    scores = total_score * 100
+
+    reproductive_factor = scores / 100 * MAX_REPRODUCTIVE_EFFICIENCY
+    potential_births = np.minimum(males, females) * (duration / GESTATION_INTERVAL)
+    total_children = (potential_births + eggs * EGG_SUCCESS_RATE) * reproductive_factor
+    survival_rate = MIN_CHILD_SURVIVAL + (scores / 100 * CHILD_SURVIVAL_GAIN)
+    surviving_children = total_children * survival_rate
+
+    return scores, total_children.astype(np.int64), surviving_children.astype(np.int64)
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _survival_probability_numba(values, ideals, weights, year_factor, total_weight):
+        n_rows, n_factors = values.shape
+        result = np.empty(n_rows)
+        for i in prange(n_rows):
+            total_score = 0.0
+            for j in range(n_factors):
+                score = min(100.0, values[i, j]) / ideals[j]
+                total_score += max(0.0, min(1.0, score)) * weights[j]
+            total_score *= year_factor
+            result[i] = max(0.0, min(100.0, total_score / total_weight * 100))
+        return result
+
+    @njit(parallel=True, cache=True)
+    def _planet_outcomes_numba(values, weights, habitable, males, females, eggs, duration):
+        n_rows, n_factors = values.shape
+        scores = np.empty(n_rows)
+        births = np.empty(n_rows, dtype=np.int64)
+        survivors = np.empty(n_rows, dtype=np.int64)
+        for i in prange(n_rows):
+            total_score = 0.0
+            for j in range(n_factors):
+                total_score += (values[i, j] / 100) * weights[j]
+            if habitable[i]:
+                total_score = min(100.0, total_score * HABITABLE_BONUS)
+            score = total_score * 100
+
+            # Uma única passada: pontuação, nascimentos e sobreviventes da linha
+            reproductive_factor = score / 100 * MAX_REPRODUCTIVE_EFFICIENCY
+            potential_births = min(males[i], females[i]) * (duration[i] / GESTATION_INTERVAL)
+            total_children = (potential_births + eggs[i] * EGG_SUCCESS_RATE) * reproductive_factor
+            survival_rate = MIN_CHILD_SURVIVAL + (score / 100 * CHILD_SURVIVAL_GAIN)
+
+            scores[i] = score
+            births[i] = int(total_children)
+            survivors[i] = int(total_children * survival_rate)
+        return scores, births, survivors
+
+def survival_probability_batch(values, ideals, weights, year_factor, use_numba=None):
+    """Probabilidade de sobrevivência (0-100) para cada linha de fatores (linhas × fatores)"""
+    values = np.ascontiguousarray(values, dtype=np.float64)
+    ideals = np.ascontiguousarray(ideals, dtype=np.float64)
+    weights = np.ascontiguousarray(weights, dtype=np.float64)
+    # Soma em Python para reproduzir exatamente o peso total de referência
+    total_weight = float(sum(weights.tolist()))
+
+    if use_numba is None:
+        use_numba = NUMBA_AVAILABLE
+    kernel = _survival_probability_numba if use_numba else _survival_probability_numpy
+    return kernel(values, ideals, weights, float(year_factor), total_weight)
+
+def planet_outcomes_batch(values, weights, habitable, males, females, eggs, duration,
+                          use_numba=None):
+    """Pontuação, nascimentos e sobreviventes para cada combinação planeta × missão"""
+    values = np.ascontiguousarray(values, dtype=np.float64)
+    weights = np.ascontiguousarray(weights, dtype=np.float64)
+    n_rows = values.shape[0]
+    # Parâmetros escalares valem para todas as linhas
+    habitable, males, females, eggs, duration = (
+        np.ascontiguousarray(np.broadcast_to(np.asarray(arr, dtype=dtype), n_rows))
+        for arr, dtype in ((habitable, np.bool_), (males, np.float64), (females, np.float64),
+                           (eggs, np.float64), (duration, np.float64))
+    )
+
+    if use_numba is None:
+        use_numba = NUMBA_AVAILABLE
+    kernel = _planet_outcomes_numba if use_numba else _planet_outcomes_numpy
+    return kernel(values, weights, habitable, males, females, eggs, duration)
+
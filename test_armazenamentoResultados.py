@@ -0,0 +1,115 @@
+import json
+import os
+
+import numpy as np
+import pytest
+
+from armazenamentoResultados import ResultWriter, ResultReader, RESULT_SCHEMA, MANIFEST_FILE
+
+def make_columns(n_rows, seed=0):
+    rng = np.random.default_rng(seed)
+    return {
+        'planet_id': rng.choice(['Marte', 'Europa', 'Terra'], n_rows),
+        'male_count': rng.integers(0, 100, n_rows),
+        'female_count': rng.integers(0, 100, n_rows),
+        'fertilized_eggs': rng.integers(0, 100, n_rows),
+        'mission_duration': np.arange(n_rows, dtype=float),
+        'score': rng.uniform(0, 100, n_rows),
+        'births': rng.integers(0, 100, n_rows),
+        'survivors': rng.integers(0, 100, n_rows),
+        'habitable': rng.random(n_rows) < 0.5,
+        'feasible': rng.random(n_rows) < 0.5,
+    }
+
+def record(columns, i):
+    return {column: values[i].item() for column, values in columns.items()}
+
+def test_chunk_boundaries_across_append_and_batch(tmp_path):
+    columns = make_columns(25)
+    with ResultWriter(tmp_path, chunk_size=10) as writer:
+        for i in range(3):
+            writer.append(record(columns, i))
+        writer.append_batch({column: values[3:24] for column, values in columns.items()})
+        writer.append(record(columns, 24))
+
+    reader = ResultReader(tmp_path)
+    assert len(reader) == 25
+    assert [chunk['rows'] for chunk in reader.manifest['chunks']] == [10, 10, 5]
+
+    data = reader.read()
+    for column, values in columns.items():
+        np.testing.assert_array_equal(data[column], values)
+
+def test_column_projection(tmp_path):
+    columns = make_columns(30)
+    with ResultWriter(tmp_path, chunk_size=10) as writer:
+        writer.append_batch(columns)
+
+    data = ResultReader(tmp_path).read(columns=['planet_id', 'score'])
+
+    assert list(data) == ['planet_id', 'score']
+    np.testing.assert_array_equal(data['score'], columns['score'])
+
+def test_pushdown_skips_chunks_and_filters_rows(tmp_path):
+    columns = make_columns(100)
+    with ResultWriter(tmp_path, chunk_size=10) as writer:
+        writer.append_batch(columns)
+
+    reader = ResultReader(tmp_path)
+    filters = [('mission_duration', '>=', 85), ('planet_id', '==', 'Marte')]
+    # Só os blocos 80-89 e 90-99 podem ter mission_duration >= 85
+    assert len(list(reader.iter_chunks(['score'], filters[:1]))) == 2
+
+    data = reader.read(['score'], filters)
+    expected = (columns['mission_duration'] >= 85) & (columns['planet_id'] == 'Marte')
+    np.testing.assert_array_equal(data['score'], columns['score'][expected])
+
+def test_nan_does_not_hide_valid_rows(tmp_path):
+    columns = make_columns(3)
+    columns['score'] = np.array([10.0, np.nan, 16.67])
+    with ResultWriter(tmp_path) as writer:
+        writer.append_batch(columns)
+
+    reader = ResultReader(tmp_path)
+    np.testing.assert_array_equal(reader.read(['score'], [('score', '>', 5)])['score'], [10.0, 16.67])
+    assert reader.manifest['chunks'][0]['stats']['score'] == [10.0, 16.67]
+    assert len(reader.read(['score'], [('score', '!=', 10.0)])['score']) == 2
+
+def test_all_nan_column_is_stored_as_null(tmp_path):
+    columns = make_columns(2)
+    columns['score'] = np.array([np.nan, np.nan])
+    with ResultWriter(tmp_path) as writer:
+        writer.append_batch(columns)
+
+    with open(os.path.join(tmp_path, MANIFEST_FILE), encoding='utf-8') as f:
+        manifest = json.loads(f.read(), parse_constant=pytest.fail)
+    assert manifest['chunks'][0]['stats']['score'] == [None, None]
+    assert len(ResultReader(tmp_path).read(['score'], [('score', '<', 5)])['score']) == 0
+
+def test_reopen_appends_new_chunks(tmp_path):
+    first, second = make_columns(15, seed=1), make_columns(7, seed=2)
+    with ResultWriter(tmp_path, chunk_size=10) as writer:
+        writer.append_batch(first)
+    with ResultWriter(tmp_path, chunk_size=10) as writer:
+        writer.append_batch(second)
+
+    reader = ResultReader(tmp_path)
+    assert len(reader) == 22
+    assert len(reader.manifest['chunks']) == 3
+    np.testing.assert_array_equal(reader.read(['score'])['score'],
+                                  np.concatenate([first['score'], second['score']]))
+
+def test_reopen_with_different_schema_fails(tmp_path):
+    with ResultWriter(tmp_path) as writer:
+        writer.append_batch(make_columns(3))
+
+    schema = dict(RESULT_SCHEMA, score=np.float32)
+    with pytest.raises(ValueError):
+        ResultWriter(tmp_path, schema=schema)
+
+def test_unknown_operator_fails_on_empty_store(tmp_path):
+    ResultWriter(tmp_path).close()
+
+    reader = ResultReader(tmp_path)
+    with pytest.raises(ValueError):
+        reader.read(filters=[('score', '~', 5)])
@@ -0,0 +1,92 @@
+import math
+
+import numpy as np
+import pytest
+
+from calculoTrajetoria import (TrajectoryCalculator, PropulsionProfile, PropulsionType,
+                               CURRENT_PROFILES, DEFAULT_PROFILES, C_MS,
+                               LIMITE_SISTEMA_PLANETARIO_AU)
+
+CHEMICAL = CURRENT_PROFILES[0]
+ONE_G = DEFAULT_PROFILES[2]
+
+@pytest.fixture
+def trajectory():
+    return TrajectoryCalculator()
+
+@pytest.mark.parametrize("distance_au, years, delta_v", [
+    (1.52, 0.707, 5.57),  # Marte
+    (5.2, 2.73, 14.43),  # Júpiter
+])
+def test_in_system_targets_use_hohmann(trajectory, distance_au, years, delta_v):
+    result = trajectory.compute([distance_au], [CHEMICAL])
+
+    assert result.travel_time_years[0, 0] == pytest.approx(years, abs=0.01)
+    assert result.delta_v[0, 0] == pytest.approx(delta_v, abs=0.01)
+    assert not result.flyby[0, 0]
+
+def test_inner_target_does_not_escape_outward(trajectory):
+    # Vênus: Hohmann para dentro, nunca um sobrevoo de escape do Sol
+    result = trajectory.compute([0.72], [CHEMICAL])
+
+    assert result.travel_time_years[0, 0] == pytest.approx(0.40, abs=0.01)
+    assert not result.flyby[0, 0]
+
+def test_interstellar_target_is_labelled_flyby(trajectory):
+    result = trajectory.compute([268770], [CHEMICAL])
+
+    assert result.feasible[0, 0]
+    assert result.flyby[0, 0]
+    assert result.delta_v[0, 0] == CHEMICAL.delta_v_budget
+
+def test_escape_only_beyond_planetary_system(trajectory):
+    inside = LIMITE_SISTEMA_PLANETARIO_AU - 1
+    outside = LIMITE_SISTEMA_PLANETARIO_AU + 1
+    result = trajectory.compute([inside, outside], [CHEMICAL])
+
+    np.testing.assert_array_equal(result.flyby[:, 0], [False, True])
+
+def test_origin_needs_no_transfer(trajectory):
+    result = trajectory.compute([1.0], DEFAULT_PROFILES)
+
+    np.testing.assert_array_equal(result.travel_time_years, 0)
+    np.testing.assert_array_equal(result.delta_v, 0)
+
+def test_constant_acceleration_delta_v_is_proper_acceleration_times_proper_time(trajectory):
+    result = trajectory.compute([268770], [ONE_G])
+
+    # τ da metade do caminho: (c/a)·acosh(1 + a·d/2c²), d medido a partir da órbita da Terra
+    d = (268770 - 1) * 1.495978707e11
+    half_proper_time = C_MS / ONE_G.acceleration * math.acosh(
+        1 + ONE_G.acceleration * d / (2 * C_MS ** 2))
+    assert result.delta_v[0, 0] == pytest.approx(2 * ONE_G.acceleration * half_proper_time / 1000)
+    assert result.travel_time_years[0, 0] == pytest.approx(5.9, abs=0.1)
+
+def test_insufficient_budget_is_infeasible(trajectory):
+    weak = PropulsionProfile("Fraca", PropulsionType.IMPULSIVA, delta_v_budget=1.0)
+    result = trajectory.compute([1.52, 268770], [weak])
+
+    assert not result.feasible.any()
+    assert np.isinf(result.travel_time_years).all()
+
+def test_result_shape_follows_catalog_order(trajectory):
+    distances = [5.2, 1.52, 5.2, 268770]
+    result = trajectory.compute(distances, DEFAULT_PROFILES)
+    single = np.vstack([trajectory.compute([d], DEFAULT_PROFILES).travel_time_years
+                        for d in distances])
+
+    assert result.travel_time_years.shape == (4, len(DEFAULT_PROFILES))
+    np.testing.assert_array_equal(result.travel_time_years, single)
+
+def test_repeated_geometries_are_cached(trajectory):
+    trajectory.compute([1.52, 5.2], DEFAULT_PROFILES)
+    trajectory.compute([5.2, 1.52, 1.52], DEFAULT_PROFILES)
+
+    info = trajectory._cached_transfer.cache_info()
+    assert info.misses == len(DEFAULT_PROFILES)
+    assert info.hits == len(DEFAULT_PROFILES)
+
+@pytest.mark.parametrize("distance_au", [0, -1.5, float('nan')])
+def test_non_positive_distance_is_rejected(trajectory, distance_au):
+    with pytest.raises(ValueError):
+        trajectory.compute([distance_au])
@@ -0,0 +1,112 @@
+import numpy as np
+import pytest
+
+from kernelsSobrevivencia import NUMBA_AVAILABLE
+from VidaNaTerra import HumanSurvivalCalculator
+from CalculoParaResultado import PlanetComparisonTool, PlanetData, ColonizationMission
+
+BACKENDS = [
+    pytest.param(False, id="numpy"),
+    pytest.param(True, id="numba",
+                 marks=pytest.mark.skipif(not NUMBA_AVAILABLE, reason="Numba não instalado")),
+]
+
+@pytest.fixture
+def calculator():
+    return HumanSurvivalCalculator()
+
+@pytest.fixture
+def tool():
+    return PlanetComparisonTool()
+
+def random_rows(n_rows, n_factors, seed=42):
+    rng = np.random.default_rng(seed)
+    return {
+        'values': rng.uniform(-10, 120, size=(n_rows, n_factors)),
+        'habitable': rng.random(n_rows) < 0.5,
+        'males': rng.integers(0, 500, n_rows),
+        'females': rng.integers(0, 500, n_rows),
+        'eggs': rng.integers(0, 1000, n_rows),
+        'duration': rng.uniform(0.5, 100, n_rows),
+    }
+
+def reference_probability(calculator, values):
+    """Probabilidade calculada linha a linha pelo método de referência"""
+    result = []
+    for row in values:
+        for factor, value in zip(calculator.factors, row):
+            calculator.factors[factor]['value'] = value
+        result.append(calculator.calculate_survival_probability())
+    return np.array(result)
+
+def reference_outcomes(tool, values, habitable, males, females, eggs, duration):
+    """Pontuação, nascimentos e sobreviventes pelos métodos de referência"""
+    n_rows = len(values)
+    habitable, males, females, eggs, duration = (
+        np.broadcast_to(arr, n_rows) for arr in (habitable, males, females, eggs, duration))
+
+    scores, births, survivors = [], [], []
+    for i, row in enumerate(values):
+        planet = PlanetData(name="Teste", distance_au=1.0, star_distance=1.0,
+                            habitable_zone=bool(habitable[i]),
+                            **dict(zip(tool.factors, row)))
+        mission = ColonizationMission()
+        mission.male_count = int(males[i])
+        mission.female_count = int(females[i])
+        mission.fertilized_eggs = int(eggs[i])
+        mission.mission_duration = float(duration[i])
+        tool.current_mission = mission
+
+        score = tool.calculate_survival_score(planet)
+        potential, surviving = tool.calculate_population_growth(score)
+        scores.append(score)
+        births.append(potential)
+        survivors.append(surviving)
+    return np.array(scores), np.array(births, dtype=np.int64), np.array(survivors, dtype=np.int64)
+
+def assert_outcomes_equal(actual, expected):
+    scores, births, survivors = actual
+    expected_scores, expected_births, expected_survivors = expected
+    np.testing.assert_allclose(scores, expected_scores, rtol=0, atol=1e-9)
+    np.testing.assert_array_equal(births, expected_births)
+    np.testing.assert_array_equal(survivors, expected_survivors)
+
+@pytest.mark.parametrize("use_numba", BACKENDS)
+def test_survival_probability_matches_reference(calculator, use_numba):
+    values = random_rows(500, len(calculator.factors))['values']
+    result = calculator.calculate_survival_probability_batch(values, use_numba=use_numba)
+    np.testing.assert_allclose(result, reference_probability(calculator, values), rtol=0, atol=1e-9)
+
+@pytest.mark.parametrize("use_numba", BACKENDS)
+def test_planet_outcomes_match_reference(tool, use_numba):
+    rows = random_rows(500, len(tool.factors))
+    args = (rows['values'], rows['habitable'], rows['males'], rows['females'],
+            rows['eggs'], rows['duration'])
+    assert_outcomes_equal(tool.evaluate_planets_batch(*args, use_numba=use_numba),
+                          reference_outcomes(tool, *args))
+
+@pytest.mark.parametrize("use_numba", BACKENDS)
+def test_empty_batch(calculator, tool, use_numba):
+    values = np.empty((0, len(calculator.factors)))
+    probability = calculator.calculate_survival_probability_batch(values, use_numba=use_numba)
+    scores, births, survivors = tool.evaluate_planets_batch(
+        values, True, 10, 10, 5, 20.0, use_numba=use_numba)
+
+    assert probability.shape == (0,)
+    assert scores.shape == births.shape == survivors.shape == (0,)
+
+@pytest.mark.parametrize("use_numba", BACKENDS)
+def test_scalar_mission_parameters_broadcast(tool, use_numba):
+    rows = random_rows(50, len(tool.factors))
+    args = (rows['values'], rows['habitable'], 120, 80, 300, 25.0)
+    assert_outcomes_equal(tool.evaluate_planets_batch(*args, use_numba=use_numba),
+                          reference_outcomes(tool, *args))
+
+@pytest.mark.parametrize("use_numba", BACKENDS)
+@pytest.mark.parametrize("habitable", [False, True], ids=["nenhum_habitavel", "todos_habitaveis"])
+def test_uniform_habitable_zone(tool, use_numba, habitable):
+    rows = random_rows(100, len(tool.factors))
+    args = (rows['values'], np.full(100, habitable), rows['males'], rows['females'],
+            rows['eggs'], rows['duration'])
+    assert_outcomes_equal(tool.evaluate_planets_batch(*args, use_numba=use_numba),
+                          reference_outcomes(tool, *args))